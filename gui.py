@@ -0,0 +1,633 @@
+import os
+import sys
+from shutil import which
+
+from typing import List, Optional, Sequence, Tuple
+
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QHeaderView,
+    QMainWindow,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QPushButton,
+    QFileDialog,
+    QInputDialog,
+    QSpinBox,
+    QMessageBox,
+    QPlainTextEdit,
+    QStyledItemDelegate,
+    QTableView,
+    QMenuBar,
+)
+from PySide6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QProcess,
+    QProcessEnvironment,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction
+
+from manager import (
+    CONFIG_FILE,
+    GIT_MISSING,
+    NPM_MISSING,
+    PM2_MISSING,
+    Project,
+    command_available,
+    load_projects,
+    parse_env,
+    save_projects,
+)
+
+# Environment inherited by launched commands together with the PATH it was
+# built from. command_available may extend PATH, which forces a rebuild.
+_base_env: Optional[Tuple[str, QProcessEnvironment]] = None
+
+
+def base_environment() -> QProcessEnvironment:
+    """Return the environment shared by all launched commands.
+
+    Reading the system environment walks every variable, so it is done once
+    and reused until ``PATH`` changes.
+    """
+    global _base_env
+    path = os.environ.get("PATH", "")
+    if _base_env is None or _base_env[0] != path:
+        _base_env = (path, QProcessEnvironment.systemEnvironment())
+    return _base_env[1]
+
+
+class ProjectRunner(QObject):
+    """Runs git and PM2 commands for a single project."""
+
+    # Emitted with the runner itself whenever ``status`` changes, letting
+    # every runner share one receiving slot.
+    status_changed = Signal(QObject)
+
+    def __init__(self, project: Project, log_cb, parent: QWidget):
+        super().__init__(parent)
+        self.project = project
+        self.log_cb = log_cb
+        # Outcome of the last command, shown in the status column
+        self.status = "Idle"
+
+        # Commands run through QProcess so git and pm2 never block the event
+        # loop. stderr is merged in as git reports progress there.
+        self.proc = QProcess(self)
+        self.proc.setProcessChannelMode(QProcess.MergedChannels)
+        self.proc.readyReadStandardOutput.connect(self._read_output)
+        self.proc.finished.connect(self._finished)
+        self.proc.errorOccurred.connect(self._error)
+        # Command currently executing and the output it produced so far
+        self._cmd: Sequence[str] = ()
+        self._output: List[str] = []
+        self._notify = False
+        self._show_output = False
+        # Trailing bytes of an output line that has not been completed yet
+        self._partial = b""
+        # Marks output lines with the project they came from
+        self._prefix = ""
+
+    def update(self, notify: bool = True) -> None:
+        """Run 'git pull origin main' in the project directory.
+
+        The output is shown in a message box when done unless ``notify`` is
+        False, in which case only the log and status are updated.
+        """
+        project = self.project
+        self._start(
+            project.argv_update,
+            project.cmdline_update,
+            "Updating...",
+            cwd=project.path,
+            notify=notify,
+            show_output=notify,
+        )
+
+    def run(self, notify: bool = True) -> None:
+        """Launch the app via PM2 using 'npm start'.
+
+        Errors are shown in a message box unless ``notify`` is False, in
+        which case they are only logged and reflected in the status.
+        """
+        # Verify that pm2 is available before attempting to run it so we can
+        # provide a friendlier error message and avoid an exception.
+        if not self._require("pm2", PM2_MISSING, notify):
+            return
+        if not self._require("npm", NPM_MISSING, notify):
+            return
+        # Copies share data with the base until modified, so this only
+        # allocates for the variables inserted below.
+        env = QProcessEnvironment(base_environment())
+        env.insert("PORT", str(self.project.port))
+        # Merge in any user-defined environment variables
+        for key, value in self.project.env.items():
+            env.insert(key, value)
+        self._start(
+            self.project.argv_run,
+            self.project.cmdline_run,
+            "Running...",
+            cwd=self.project.path,
+            env=env,
+            notify=notify,
+        )
+
+    def stop(self, notify: bool = True) -> None:
+        """Stop the PM2 process if it is running.
+
+        Errors are shown in a message box unless ``notify`` is False, in
+        which case they are only logged and reflected in the status.
+        """
+        # Ensure pm2 is present before invoking it to prevent runtime errors
+        if not self._require("pm2", PM2_MISSING, notify):
+            return
+        # Invoke PM2 to stop the process by name
+        self._start(
+            self.project.argv_stop,
+            self.project.cmdline_stop,
+            "Stopping...",
+            notify=notify,
+        )
+
+    def _set_status(self, status: str) -> None:
+        self.status = status
+        self.status_changed.emit(self)
+
+    def _start(
+        self,
+        cmd: Sequence[str],
+        cmdline: str,
+        status: str,
+        cwd: Optional[str] = None,
+        env: Optional[QProcessEnvironment] = None,
+        notify: bool = True,
+        show_output: bool = False,
+    ) -> None:
+        """Start ``cmd`` without blocking the GUI.
+
+        Output is forwarded to the log as it arrives and the status is
+        updated once the process finishes.  When ``show_output`` is set the
+        full output is also shown in a message box, and ``notify`` controls
+        whether a failure to start is reported in one.  ``cmdline`` is the
+        printable form of ``cmd`` written to the log.
+        """
+        # Each project owns a single QProcess, so only one command may run at
+        # a time per project. Other projects are unaffected.
+        if self.proc.state() != QProcess.NotRunning:
+            self.log_cb(f"{self.project.name}: a command is still running")
+            return
+        self._cmd = cmd
+        self._output = []
+        self._notify = notify
+        self._show_output = show_output
+        self._partial = b""
+        # Built once per command as the name can only change between commands
+        self._prefix = f"[{self.project.name}] "
+        self._set_status(status)
+        if cwd:
+            self.log_cb("Running: " + cmdline + " in " + cwd)
+        else:
+            self.log_cb("Running: " + cmdline)
+        # An empty working directory makes the child inherit ours
+        self.proc.setWorkingDirectory(cwd or "")
+        self.proc.setProcessEnvironment(env if env is not None else base_environment())
+        # Resolve the full path so wrappers such as pm2.cmd start on Windows
+        self.proc.start(which(cmd[0]) or cmd[0], list(cmd[1:]))
+
+    def _read_output(self) -> None:
+        """Forward complete lines from the running command to the log."""
+        data = self._partial + bytes(self.proc.readAllStandardOutput())
+        lines = data.replace(b"\r\n", b"\n").split(b"\n")
+        # Keep an unfinished last line until the rest of it arrives
+        self._partial = lines.pop()
+        if lines:
+            self._log_lines(lines)
+
+    def _log_lines(self, lines: List[bytes]) -> None:
+        """Decode output lines, log them and keep them for the summary."""
+        text = b"\n".join(lines).decode(errors="replace")
+        self._output.append(text)
+        # Projects may run concurrently, so tag every line with its origin
+        self.log_cb(self._prefix + text.replace("\n", "\n" + self._prefix))
+
+    def _finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        """Show the outcome of the command that just completed."""
+        if self._partial:
+            self._log_lines([self._partial])
+            self._partial = b""
+        ok = exit_status == QProcess.NormalExit and exit_code == 0
+        self._set_status("OK" if ok else "Error")
+        if self._show_output:
+            QMessageBox.information(self.parent(), self.project.name, "\n".join(self._output))
+
+    def _error(self, error: QProcess.ProcessError) -> None:
+        """Report commands that could not be started."""
+        # Crashes are reported through ``finished``; only handle launch errors
+        if error != QProcess.FailedToStart:
+            return
+        self._fail(
+            f"{self._cmd[0]} not found. Is it installed and on your PATH?", self._notify
+        )
+
+    def _require(self, cmd: str, err: str, notify: bool = True) -> bool:
+        """Return True if ``cmd`` is available, otherwise report ``err``."""
+        if command_available(cmd):
+            return True
+        self._fail(err, notify)
+        return False
+
+    def _fail(self, err: str, notify: bool = True) -> None:
+        """Log an error and flag the project.
+
+        The message is also shown to the user unless ``notify`` is False,
+        which batch operations use to avoid one dialog per project.
+        """
+        self.log_cb(f"[{self.project.name}] {err}")
+        self._set_status("Error")
+        if notify:
+            QMessageBox.critical(self.parent(), self.project.name, err)
+
+
+class ProjectsModel(QAbstractTableModel):
+    """Table model listing projects and the state of their commands."""
+
+    COLUMNS = ("Path", "Name", "Port", "Status")
+    PATH, NAME, PORT, STATUS = range(len(COLUMNS))
+
+    def __init__(self, save_cb, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.save_cb = save_cb
+        # One runner per row, each wrapping the project shown in that row
+        self.runners: List[ProjectRunner] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.runners)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        runner = self.runners[index.row()]
+        column = index.column()
+        if column == self.PATH:
+            return runner.project.path
+        if column == self.NAME:
+            return runner.project.name
+        if column == self.PORT:
+            return runner.project.port
+        return runner.status
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        # The port is edited in place; everything else goes through actions
+        if index.column() == self.PORT:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        """Update the project port and save configuration."""
+        if role != Qt.EditRole or index.column() != self.PORT:
+            return False
+        project = self.runners[index.row()].project
+        if project.port != value:
+            project.port = value
+            self.dataChanged.emit(index, index)
+            self.save_cb()
+        return True
+
+    def add_runner(self, runner: ProjectRunner) -> None:
+        """Append a row for ``runner`` and track its status."""
+        row = len(self.runners)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.runners.append(runner)
+        self.endInsertRows()
+        runner.status_changed.connect(self.refresh)
+
+    def refresh(self, runner: ProjectRunner) -> None:
+        """Repaint the row belonging to ``runner``."""
+        row = self.runners.index(runner)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+
+class PortDelegate(QStyledItemDelegate):
+    """Edits ports with a spin box limited to valid port numbers."""
+
+    def createEditor(self, parent: QWidget, option, index: QModelIndex) -> QWidget:
+        editor = QSpinBox(parent)
+        editor.setRange(1, 65535)
+        editor.setFrame(False)
+        return editor
+
+
+class MainWindow(QMainWindow):
+    """Main application window for managing Node.js apps."""
+
+    def __init__(self, projects: List[Project]):
+        super().__init__()
+        self.projects = projects
+        self.setWindowTitle("PM2 Frontend")
+
+        # Saves are debounced so bursts of edits (e.g. holding an arrow key
+        # on a port spin box) result in a single write of the final state.
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._save_now)
+
+        # Build a simple menu providing common actions
+        menubar = QMenuBar(self)
+        self.setMenuBar(menubar)
+        file_menu = menubar.addMenu("File")
+
+        add_act = QAction("Add Project", self)
+        add_act.triggered.connect(self._add_project)
+        file_menu.addAction(add_act)
+
+        # Commands for every project start together and run concurrently
+        update_all_act = QAction("Update All", self)
+        update_all_act.triggered.connect(self._update_all)
+        file_menu.addAction(update_all_act)
+
+        run_all_act = QAction("Run All", self)
+        run_all_act.triggered.connect(self._run_all)
+        file_menu.addAction(run_all_act)
+
+        clear_act = QAction("Clear Log", self)
+        clear_act.triggered.connect(self._clear_log)
+        file_menu.addAction(clear_act)
+
+        quit_act = QAction("Quit", self)
+        quit_act.triggered.connect(self.close)
+        file_menu.addAction(quit_act)
+
+        # Toolbar commands apply to every project selected in the table,
+        # while the editing actions need exactly one selected project.
+        toolbar = self.addToolBar("Project")
+        self.command_actions: List[QAction] = []
+        self.edit_actions: List[QAction] = []
+        for text, slot, group in (
+            ("Update", self._update, self.command_actions),
+            ("Run", self._run, self.command_actions),
+            ("Stop", self._stop, self.command_actions),
+            ("Change Name", self._change_name, self.edit_actions),
+            ("Edit Env", self._edit_env, self.edit_actions),
+        ):
+            act = QAction(text, self)
+            act.triggered.connect(slot)
+            toolbar.addAction(act)
+            group.append(act)
+
+        central = QWidget()
+        self.setCentralWidget(central)
+        main_layout = QVBoxLayout()
+        central.setLayout(main_layout)
+
+        # A single model-backed table lists every project. Only visible rows
+        # are painted, so large setups stay cheap to display.
+        self.model = ProjectsModel(self._save, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(ProjectsModel.PORT, PortDelegate(self.table))
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(
+            ProjectsModel.PATH, QHeaderView.Stretch
+        )
+        self.table.selectionModel().selectionChanged.connect(self._selection_changed)
+        main_layout.addWidget(self.table)
+
+        for project in self.projects:
+            self._add_project_row(project)
+        self._selection_changed()
+
+        # Control buttons placed above the log area for quick access
+        # Row of buttons with common actions
+        btn_row = QHBoxLayout()
+        add_btn = QPushButton("Add Project")
+        add_btn.clicked.connect(self._add_project)
+        btn_row.addWidget(add_btn)
+
+        clear_btn = QPushButton("Clear Log")
+        clear_btn.clicked.connect(self._clear_log)
+        btn_row.addWidget(clear_btn)
+        main_layout.addLayout(btn_row)
+
+        # Log widget displays executed commands and their output. Old lines
+        # are dropped once the limit is reached and no undo history is kept.
+        # Lines are not wrapped, which saves re-laying out long output lines.
+        self.log = QPlainTextEdit()
+        self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(2000)
+        self.log.setUndoRedoEnabled(False)
+        self.log.setLineWrapMode(QPlainTextEdit.NoWrap)
+        main_layout.addWidget(self.log)
+
+        # Messages are collected briefly and appended in one go so chatty
+        # commands do not trigger a relayout for every line.
+        self._log_buf: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
+    def _add_project_row(self, project: Project) -> None:
+        runner = ProjectRunner(project, self._log_message, self)
+        # Each project is represented by a row in the table
+        self.model.add_runner(runner)
+
+    def _selected_runners(self) -> List[ProjectRunner]:
+        """Return the runners of all selected rows in display order."""
+        rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
+        return [self.model.runners[row] for row in rows]
+
+    def _single_runner(self) -> Optional[ProjectRunner]:
+        """Return the runner of the only selected row, if exactly one is."""
+        runners = self._selected_runners()
+        return runners[0] if len(runners) == 1 else None
+
+    def _selection_changed(self) -> None:
+        """Enable project actions to match the number of selected rows."""
+        count = len(self.table.selectionModel().selectedRows())
+        for act in self.command_actions:
+            act.setEnabled(count > 0)
+        for act in self.edit_actions:
+            act.setEnabled(count == 1)
+
+    def _update(self) -> None:
+        runners = self._selected_runners()
+        # A result dialog per project would pile up, so only show one when a
+        # single project is updated.
+        for runner in runners:
+            runner.update(notify=len(runners) == 1)
+
+    def _run(self) -> None:
+        runners = self._selected_runners()
+        # Several projects are checked once up front so a missing tool gives
+        # one dialog rather than one per project.
+        single = len(runners) == 1
+        if not single and not self._batch_require((("pm2", PM2_MISSING), ("npm", NPM_MISSING))):
+            return
+        for runner in runners:
+            runner.run(notify=single)
+
+    def _stop(self) -> None:
+        runners = self._selected_runners()
+        single = len(runners) == 1
+        if not single and not self._batch_require((("pm2", PM2_MISSING),)):
+            return
+        for runner in runners:
+            runner.stop(notify=single)
+
+    def _update_all(self) -> None:
+        """Pull every project at once, reporting results in the log."""
+        if not self._batch_require((("git", GIT_MISSING),)):
+            return
+        for runner in self.model.runners:
+            runner.update(notify=False)
+
+    def _run_all(self) -> None:
+        """Start every project under PM2, reporting errors in the log."""
+        if not self._batch_require((("pm2", PM2_MISSING), ("npm", NPM_MISSING))):
+            return
+        for runner in self.model.runners:
+            runner.run(notify=False)
+
+    def _batch_require(self, tools) -> bool:
+        """Check ``(command, error)`` pairs once before a batch operation.
+
+        The first missing command is reported in a single dialog instead of
+        once per project.
+        """
+        for cmd, err in tools:
+            if not command_available(cmd):
+                self._log_message(err)
+                QMessageBox.critical(self, "PM2 Frontend", err)
+                return False
+        return True
+
+    def _change_name(self) -> None:
+        """Prompt the user for a new process name and save it."""
+        runner = self._single_runner()
+        if runner is None:
+            return
+        project = runner.project
+        # Let the user enter a new name. If none is provided, keep the current
+        # one.
+        new_name, ok = QInputDialog.getText(self, "Process Name", "New name:", text=project.name)
+        if not ok or not new_name:
+            return
+        project.rename(new_name)
+        self.model.refresh(runner)
+        self._save()
+
+    def _edit_env(self) -> None:
+        """Allow editing of custom environment variables."""
+        runner = self._single_runner()
+        if runner is None:
+            return
+        project = runner.project
+        # Prepare a multi-line string in KEY=VALUE format
+        current = "\n".join(f"{k}={v}" for k, v in project.env.items())
+        text, ok = QInputDialog.getMultiLineText(
+            self,
+            "Environment Variables",
+            "KEY=VALUE per line:",
+            current,
+        )
+        if not ok:
+            return
+        project.env = parse_env(text)
+        self._save()
+
+    def _log_message(self, msg: str) -> None:
+        """Queue a message for the log widget."""
+        self._log_buf.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """Append all queued messages to the log widget."""
+        if self._log_buf:
+            self.log.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
+
+    def _clear_log(self) -> None:
+        """Remove all text from the log widget."""
+        self._log_timer.stop()
+        self._log_buf.clear()
+        self.log.clear()
+
+    def _add_project(self) -> None:
+        # Ask the user for a project directory
+        path = QFileDialog.getExistingDirectory(self, "Select Node.js Project")
+        if not path:
+            return
+        # Ask for the port the app should listen on
+        port, ok = QInputDialog.getInt(self, "Port", "Port:", 3000, 1, 65535)
+        if not ok:
+            return
+        # Ask for an optional PM2 process name
+        name, ok = QInputDialog.getText(self, "Process Name", "Process name:")
+        if not ok or not name:
+            name = None
+        # Ask for optional environment variables
+        env_text, ok = QInputDialog.getMultiLineText(
+            self,
+            "Environment Variables",
+            "KEY=VALUE per line:",
+        )
+        env = parse_env(env_text) if ok else {}
+        project = Project(path, port, name, env)
+        self.projects.append(project)
+        self._add_project_row(project)
+        self._save()
+
+    def _save(self) -> None:
+        """Schedule writing the current configuration to disk."""
+        self._save_timer.start()
+
+    def _save_now(self) -> None:
+        """Write the configuration, which is skipped if it is unchanged."""
+        self._save_timer.stop()
+        save_projects(CONFIG_FILE, self.projects)
+
+    def closeEvent(self, event) -> None:
+        """Flush any pending save before the window closes."""
+        if self._save_timer.isActive():
+            self._save_now()
+        super().closeEvent(event)
+
+
+def main() -> int:
+    """Show the main window and run the Qt event loop."""
+    app = QApplication(sys.argv)
+    # Warn early if pm2 is missing so the user can fix their environment
+    if not command_available("pm2"):
+        QMessageBox.critical(None, "PM2 Missing", (
+            "pm2 was not found. Install it with 'npm install -g pm2' and ensure "
+            "the installation directory is listed in your PATH."))
+    # Capture the environment now, after command_available may have extended
+    # PATH, so the first Run click does not pay for it.
+    base_environment()
+    projects = load_projects(CONFIG_FILE)
+    window = MainWindow(projects)
+    window.show()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
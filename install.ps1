@@ -41,4 +41,4 @@ Write-Host "== Installing Python packages =="
 python -m pip install --upgrade pip
 python -m pip install -r requirements.txt
 
-Write-Host "Setup complete. Run 'python manager.py' to start the GUI."
+Write-Host "Setup complete. Run 'python gui.py' to start the GUI."
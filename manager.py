@@ -1,33 +1,37 @@
+import hashlib
 import json
 import os
-import subprocess
+import re
 import sys
 from shutil import which
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
-from PySide6.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
-    QLabel,
-    QPushButton,
-    QFileDialog,
-    QInputDialog,
-    QSpinBox,
-    QMessageBox,
-    QPlainTextEdit,
-    QScrollArea,
-    QMenuBar,
-)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction
+try:
+    # Optional C-accelerated JSON library used when installed
+    import orjson
+except ImportError:
+    orjson = None
 
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), "projects.json")
 
+PM2_MISSING = "pm2 not found. Install it with 'npm install -g pm2' and ensure it's on your PATH."
+NPM_MISSING = "npm not found. Is Node.js installed and on your PATH?"
+GIT_MISSING = "git not found. Is it installed and on your PATH?"
+
+# One ``KEY=VALUE`` pair per line. Whitespace around the key and value is
+# ignored and lines without a key are skipped.
+_ENV_RE = re.compile(r"^[^\S\n]*([^=\s]+)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.M)
+
+# Decoded project fields keyed by file path. Each entry records the file's
+# mtime and size so it is only reused while the file is unchanged.
+_Entry = Tuple[str, int, Optional[str], Dict[str, str]]
+_cfg_cache: Dict[str, Tuple[int, int, List[_Entry]]] = {}
+# Digest of the last content written to each configuration file
+_saved_digests: Dict[str, bytes] = {}
+
 @dataclass
 class Project:
     """Represents a Node.js application managed with PM2."""
@@ -38,12 +42,57 @@ class Project:
     custom_name: Optional[str] = None
     # Optional additional environment variables used when running the project
     env: Dict[str, str] = field(default_factory=dict)
+    # Folder name derived from ``path``, computed once since abspath queries
+    # the current directory on every call.
+    _folder_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._folder_name = os.path.basename(os.path.abspath(self.path))
 
     @property
     def name(self) -> str:
         """Return the PM2 process name."""
         # Use the custom name if provided, otherwise fallback to folder name
-        return self.custom_name or os.path.basename(os.path.abspath(self.path))
+        return self.custom_name or self._folder_name
+
+    # Command lines are built once and reused for every button click. Those
+    # containing the process name are dropped again by ``rename``.
+    @cached_property
+    def argv_update(self) -> Tuple[str, ...]:
+        """Return the command pulling the latest changes."""
+        return ("git", "pull", "origin", "main")
+
+    @cached_property
+    def argv_run(self) -> Tuple[str, ...]:
+        """Return the command starting the app under PM2."""
+        return ("pm2", "start", "npm", "--name", self.name, "--", "start")
+
+    @cached_property
+    def argv_stop(self) -> Tuple[str, ...]:
+        """Return the command stopping the PM2 process."""
+        return ("pm2", "stop", self.name)
+
+    # Printable forms of the commands above, used for log messages
+    @cached_property
+    def cmdline_update(self) -> str:
+        """Return the pull command as a single string."""
+        return " ".join(self.argv_update)
+
+    @cached_property
+    def cmdline_run(self) -> str:
+        """Return the start command as a single string."""
+        return " ".join(self.argv_run)
+
+    @cached_property
+    def cmdline_stop(self) -> str:
+        """Return the stop command as a single string."""
+        return " ".join(self.argv_stop)
+
+    def rename(self, name: str) -> None:
+        """Set a custom PM2 process name."""
+        self.custom_name = name
+        for attr in ("argv_run", "argv_stop", "cmdline_run", "cmdline_stop"):
+            self.__dict__.pop(attr, None)
 
 
 def command_available(cmd: str) -> bool:
@@ -69,25 +118,37 @@ def command_available(cmd: str) -> bool:
     return False
 
 
+def parse_env(text: str) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` lines into a dictionary, ignoring other lines."""
+    return dict(_ENV_RE.findall(text))
+
+
 def load_projects(cfg_path: str) -> List[Project]:
     """Load project configuration from JSON."""
-    if not os.path.exists(cfg_path):
+    try:
+        st = os.stat(cfg_path)
+    except FileNotFoundError:
         return []
-    with open(cfg_path) as fh:
-        data = json.load(fh)
-    # Map loaded JSON dictionaries to Project instances, preserving any
-    # custom name that was saved previously.
-    return [
-        Project(
-            p["path"],
-            p.get("port", 3000),
-            p.get("name"),
-            # Load optional environment variable mapping
-            p.get("env", {}),
-        )
-        for p in data.get("projects", [])
-    ]
-
+    cached = _cfg_cache.get(cfg_path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        entries = cached[2]
+    else:
+        # Read the whole file at once so the decoder works on a single buffer
+        with open(cfg_path, "rb") as fh:
+            raw = fh.read()
+        # Saving the loaded projects unchanged should not rewrite the file
+        _saved_digests[cfg_path] = hashlib.blake2b(raw, digest_size=8).digest()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        # Keep the decoded fields, preserving any custom name that was saved
+        # previously and the optional environment variable mapping.
+        entries = [
+            (p["path"], p.get("port", 3000), p.get("name"), p.get("env", {}))
+            for p in data.get("projects", [])
+        ]
+        _cfg_cache[cfg_path] = (st.st_mtime_ns, st.st_size, entries)
+    # Build fresh projects with their own env dicts so callers can modify
+    # them without touching the cache.
+    return [Project(path, port, name, dict(env)) for path, port, name, env in entries]
 
 def save_projects(cfg_path: str, projects: List[Project]) -> None:
     """Persist project configuration to JSON."""
@@ -105,308 +166,29 @@ def save_projects(cfg_path: str, projects: List[Project]) -> None:
             for p in projects
         ]
     }
-    with open(cfg_path, "w") as fh:
-        json.dump(data, fh, indent=2)
-
-
-class ProjectRow(QWidget):
-    """Widget row for a single project."""
-
-    def __init__(self, project: Project, save_cb, log_cb):
-        super().__init__()
-        self.project = project
-        self.save_cb = save_cb
-        self.log_cb = log_cb
-
-        layout = QHBoxLayout()
-        self.setLayout(layout)
-
-        self.path_label = QLabel(project.path)
-        layout.addWidget(self.path_label)
-
-        # Display the current PM2 process name
-        self.name_label = QLabel(project.name)
-        layout.addWidget(self.name_label)
-
-        self.port_spin = QSpinBox()
-        self.port_spin.setRange(1, 65535)
-        self.port_spin.setValue(project.port)
-        self.port_spin.valueChanged.connect(self._port_changed)
-        layout.addWidget(self.port_spin)
-
-        update_btn = QPushButton("Update")
-        update_btn.clicked.connect(self._update)
-        layout.addWidget(update_btn)
-
-        run_btn = QPushButton("Run")
-        run_btn.clicked.connect(self._run)
-        layout.addWidget(run_btn)
-
-        stop_btn = QPushButton("Stop")
-        stop_btn.clicked.connect(self._stop)
-        layout.addWidget(stop_btn)
-
-        rename_btn = QPushButton("Change Name")
-        rename_btn.clicked.connect(self._change_name)
-        layout.addWidget(rename_btn)
-
-        env_btn = QPushButton("Edit Env")
-        env_btn.clicked.connect(self._edit_env)
-        layout.addWidget(env_btn)
-
-        # status label to display the last command outcome
-        self.status_label = QLabel("Idle")
-        layout.addWidget(self.status_label)
-
-    def _port_changed(self, value: int) -> None:
-        """Update the project port and save configuration."""
-        self.project.port = value
-        self.save_cb()
-
-    def _update(self) -> None:
-        """Run 'git pull origin main' in the project directory."""
-        cmd = ["git", "pull", "origin", "main"]
-        self.status_label.setText("Updating...")
-        self.log_cb(f"Running: {' '.join(cmd)} in {self.project.path}")
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.project.path,
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
-            # git executable could not be located - show an error message
-            err = f"{cmd[0]} not found. Is it installed and on your PATH?"
-            self.log_cb(err)
-            self.status_label.setText("Error")
-            QMessageBox.critical(self, self.project.name, err)
-            return
-        self.log_cb(result.stdout or result.stderr)
-        self.status_label.setText("OK" if result.returncode == 0 else "Error")
-        QMessageBox.information(self, self.project.name, result.stdout or result.stderr)
-
-    def _run(self) -> None:
-        """Launch the app via PM2 using 'npm start'."""
-        # Verify that pm2 is available before attempting to run it so we can
-        # provide a friendlier error message and avoid an exception.
-        if not command_available("pm2"):
-            err = "pm2 not found. Install it with 'npm install -g pm2' and ensure it's on your PATH."
-            self.log_cb(err)
-            self.status_label.setText("Error")
-            QMessageBox.critical(self, self.project.name, err)
-            return
-        if not command_available("npm"):
-            err = "npm not found. Is Node.js installed and on your PATH?"
-            self.log_cb(err)
-            self.status_label.setText("Error")
-            QMessageBox.critical(self, self.project.name, err)
-            return
-        env = os.environ.copy()
-        env["PORT"] = str(self.project.port)
-        # Merge in any user-defined environment variables
-        env.update(self.project.env)
-        cmd = ["pm2", "start", "npm", "--name", self.project.name, "--", "start"]
-        self.status_label.setText("Running...")
-        self.log_cb(f"Running: {' '.join(cmd)} in {self.project.path}")
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.project.path,
-                env=env,
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
-            # PM2 or npm could not be located. Inform the user and abort.
-            err = f"{cmd[0]} not found. Is it installed and on your PATH?"
-            self.log_cb(err)
-            self.status_label.setText("Error")
-            QMessageBox.critical(self, self.project.name, err)
-            return
-        self.log_cb(result.stdout or result.stderr)
-        self.status_label.setText("OK" if result.returncode == 0 else "Error")
-
-    def _stop(self) -> None:
-        """Stop the PM2 process if it is running."""
-        # Ensure pm2 is present before invoking it to prevent runtime errors
-        if not command_available("pm2"):
-            err = "pm2 not found. Install it with 'npm install -g pm2' and ensure it's on your PATH."
-            self.log_cb(err)
-            self.status_label.setText("Error")
-            QMessageBox.critical(self, self.project.name, err)
-            return
-        # Invoke PM2 to stop the process by name
-        cmd = ["pm2", "stop", self.project.name]
-        self.status_label.setText("Stopping...")
-        self.log_cb(f"Running: {' '.join(cmd)}")
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
-            # pm2 command missing - cannot stop the process
-            err = f"{cmd[0]} not found. Is it installed and on your PATH?"
-            self.log_cb(err)
-            self.status_label.setText("Error")
-            QMessageBox.critical(self, self.project.name, err)
-            return
-        self.log_cb(result.stdout or result.stderr)
-        self.status_label.setText("OK" if result.returncode == 0 else "Error")
-
-    def _change_name(self) -> None:
-        """Prompt the user for a new process name and save it."""
-        # Let the user enter a new name. If none is provided, keep the current
-        # one.
-        new_name, ok = QInputDialog.getText(self, "Process Name", "New name:", text=self.project.name)
-        if not ok or not new_name:
-            return
-        self.project.custom_name = new_name
-        self.name_label.setText(self.project.name)
-        self.save_cb()
-
-    def _edit_env(self) -> None:
-        """Allow editing of custom environment variables."""
-        # Prepare a multi-line string in KEY=VALUE format
-        current = "\n".join(f"{k}={v}" for k, v in self.project.env.items())
-        text, ok = QInputDialog.getMultiLineText(
-            self,
-            "Environment Variables",
-            "KEY=VALUE per line:",
-            current,
-        )
-        if not ok:
-            return
-        env = {}
-        for line in text.splitlines():
-            if "=" in line:
-                k, v = line.split("=", 1)
-                env[k.strip()] = v.strip()
-        self.project.env = env
-        self.save_cb()
-
-
-class MainWindow(QMainWindow):
-    """Main application window for managing Node.js apps."""
-
-    def __init__(self, projects: List[Project]):
-        super().__init__()
-        self.projects = projects
-        self.setWindowTitle("PM2 Frontend")
-
-        # Build a simple menu providing common actions
-        menubar = QMenuBar(self)
-        self.setMenuBar(menubar)
-        file_menu = menubar.addMenu("File")
-
-        add_act = QAction("Add Project", self)
-        add_act.triggered.connect(self._add_project)
-        file_menu.addAction(add_act)
-
-        clear_act = QAction("Clear Log", self)
-        clear_act.triggered.connect(self._clear_log)
-        file_menu.addAction(clear_act)
-
-        quit_act = QAction("Quit", self)
-        quit_act.triggered.connect(self.close)
-        file_menu.addAction(quit_act)
-
-        central = QWidget()
-        self.setCentralWidget(central)
-        main_layout = QVBoxLayout()
-        central.setLayout(main_layout)
-
-        # Container for project rows is placed inside a scroll area so
-        # the interface remains usable when many projects are configured.
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        self.list_widget = QWidget()
-        self.list_layout = QVBoxLayout()
-        self.list_layout.setAlignment(Qt.AlignTop)
-        self.list_widget.setLayout(self.list_layout)
-        scroll.setWidget(self.list_widget)
-        main_layout.addWidget(scroll)
-
-        for project in self.projects:
-            self._add_project_row(project)
-
-        # Control buttons placed above the log area for quick access
-        # Row of buttons with common actions
-        btn_row = QHBoxLayout()
-        add_btn = QPushButton("Add Project")
-        add_btn.clicked.connect(self._add_project)
-        btn_row.addWidget(add_btn)
-
-        clear_btn = QPushButton("Clear Log")
-        clear_btn.clicked.connect(self._clear_log)
-        btn_row.addWidget(clear_btn)
-        main_layout.addLayout(btn_row)
-
-        # Log widget displays executed commands and their output
-        self.log = QPlainTextEdit()
-        self.log.setReadOnly(True)
-        main_layout.addWidget(self.log)
-
-    def _add_project_row(self, project: Project) -> None:
-        row = ProjectRow(project, self._save, self._log_message)
-        # Each project is represented by a row inside the scroll area
-        self.list_layout.addWidget(row)
-
-    def _log_message(self, msg: str) -> None:
-        """Append a message to the log widget."""
-        self.log.appendPlainText(msg)
-
-    def _clear_log(self) -> None:
-        """Remove all text from the log widget."""
-        self.log.clear()
-
-    def _add_project(self) -> None:
-        # Ask the user for a project directory
-        path = QFileDialog.getExistingDirectory(self, "Select Node.js Project")
-        if not path:
-            return
-        # Ask for the port the app should listen on
-        port, ok = QInputDialog.getInt(self, "Port", "Port:", 3000, 1, 65535)
-        if not ok:
-            return
-        # Ask for an optional PM2 process name
-        name, ok = QInputDialog.getText(self, "Process Name", "Process name:")
-        if not ok or not name:
-            name = None
-        # Ask for optional environment variables
-        env_text, ok = QInputDialog.getMultiLineText(
-            self,
-            "Environment Variables",
-            "KEY=VALUE per line:",
-        )
-        if not ok:
-            env = {}
-        else:
-            env = {}
-            for line in env_text.splitlines():
-                if "=" in line:
-                    k, v = line.split("=", 1)
-                    env[k.strip()] = v.strip()
-        project = Project(path, port, name, env)
-        self.projects.append(project)
-        self._add_project_row(project)
-        self._save()
-
-    def _save(self) -> None:
-        """Write the current configuration to disk."""
-        save_projects(CONFIG_FILE, self.projects)
+    # Encode up front so the file receives a single write instead of one per
+    # JSON token.
+    if orjson:
+        blob = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        blob = json.dumps(data, indent=2).encode("utf-8")
+    digest = hashlib.blake2b(blob, digest_size=8).digest()
+    if _saved_digests.get(cfg_path) == digest:
+        return
+    # Write to a sibling file and swap it in so a crash mid-write never
+    # leaves a truncated configuration behind.
+    tmp_path = cfg_path + ".tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(blob)
+    os.replace(tmp_path, cfg_path)
+    _saved_digests[cfg_path] = digest
+    # The file changed, so any previously parsed copy is stale
+    _cfg_cache.pop(cfg_path, None)
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    # Warn early if pm2 is missing so the user can fix their environment
-    if not command_available("pm2"):
-        QMessageBox.critical(None, "PM2 Missing", (
-            "pm2 was not found. Install it with 'npm install -g pm2' and ensure "
-            "the installation directory is listed in your PATH."))
-    projects = load_projects(CONFIG_FILE)
-    window = MainWindow(projects)
-    window.show()
-    sys.exit(app.exec())
+    # The GUI entry point lives in gui.py; Qt is only imported from there so
+    # the configuration helpers above can be used without loading PySide6.
+    from gui import main
+
+    sys.exit(main())